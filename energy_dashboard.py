@@ -1,11 +1,23 @@
+import atexit
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import os
 from pathlib import Path
 import logging
-from typing import List, Dict
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import re
+import warnings
+from typing import Dict, Iterator, List, NamedTuple
 
+import numba
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pac
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 
 # ----------------- CONFIG -----------------
@@ -16,46 +28,141 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 
 LOG_FILE = OUTPUT_DIR / "energy_dashboard.log"
 
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+# bump whenever load_energy_data changes the shape of the frame it returns
+# (columns, dtypes, row order) so stale ingest caches are rebuilt
+INGEST_CACHE_VERSION = 3
+
+# records go through a queue; a listener thread does the file I/O
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_file_handler = logging.FileHandler(LOG_FILE)
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+)
+_log_listener = QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_queue_handler = QueueHandler(_log_queue)
+# only merge args here; the file handler adds time and level
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+
+CSV_SCHEMA = pa.schema(
+    [
+        ("timestamp", pa.timestamp("ns")),
+        ("kwh", pa.float64()),
+        ("building", pa.string()),
+    ]
 )
+CSV_CONVERT_OPTIONS = pac.ConvertOptions(
+    column_types={"timestamp": pa.timestamp("ns"), "kwh": pa.float64()},
+    strings_can_be_null=True,
+)
+CSV_PARSE_OPTIONS = pac.ParseOptions(invalid_row_handler=lambda row: "skip")
+TIMESTAMP_FORMATS = ("%Y-%m-%d %H:%M:%S", "ISO8601")
+TZ_SUFFIX = r"(?:Z|[+-]\d{2}:?\d{2})\s*$"  # trailing UTC offset
+
+
+# ----------------- REDUCTION KERNEL -----------------
+@numba.njit(nogil=True, cache=True)
+def _reduce_group(labels, values, n_groups):
+    # single fused pass producing per-group sum/min/max/count; like pandas,
+    # NaN readings are skipped and not counted
+    out_sum = np.zeros(n_groups)
+    out_min = np.full(n_groups, np.inf)
+    out_max = np.full(n_groups, -np.inf)
+    out_cnt = np.zeros(n_groups, np.int64)
+    for i in range(values.shape[0]):
+        g = labels[i]
+        v = values[i]
+        if np.isnan(v):
+            continue
+        out_sum[g] += v
+        out_cnt[g] += 1
+        if v < out_min[g]:
+            out_min[g] = v
+        if v > out_max[g]:
+            out_max[g] = v
+    return out_sum, out_min, out_max, out_cnt
+
+
+@numba.njit(nogil=True, cache=True)
+def _reduce_array(values):
+    # sum/min/max/count of one array in a single loop, skipping NaN
+    total = 0.0
+    lo = np.inf
+    hi = -np.inf
+    cnt = 0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if np.isnan(v):
+            continue
+        total += v
+        cnt += 1
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+    return total, lo, hi, cnt
+
+
+# compile up front so main() does not pay for it
+_reduce_group(np.zeros(2, np.int64), np.zeros(2), 1)
+_reduce_array(np.zeros(2))
 
 
 # ----------------- TASK 3: OOP MODEL -----------------
 class MeterReading:
+    __slots__ = ("timestamp", "kwh")
+
     def __init__(self, timestamp: pd.Timestamp, kwh: float):
         self.timestamp = timestamp
         self.kwh = kwh
 
 
 class Building:
+    __slots__ = ("name", "timestamps", "kwh")
+
     def __init__(self, name: str):
         self.name = name
-        self.meter_readings: List[MeterReading] = []
+        # readings are stored column-wise as two parallel arrays
+        self.timestamps = np.empty(0, dtype="datetime64[ns]")
+        self.kwh = np.empty(0, dtype=np.float64)
 
     def add_reading(self, reading: MeterReading):
-        self.meter_readings.append(reading)
+        self.extend_readings([reading.timestamp], [reading.kwh])
+
+    def extend_readings(self, ts_arr, kwh_arr):
+        ts_arr = np.asarray(ts_arr, dtype="datetime64[ns]")
+        kwh_arr = np.asarray(kwh_arr)
+        if kwh_arr.dtype == np.float32:
+            # widen via the shortest repr so 40.69f stays 40.69, not 40.689999
+            kwh_arr = kwh_arr.astype(str)
+        kwh_arr = kwh_arr.astype(np.float64)
+        if ts_arr.shape != kwh_arr.shape:
+            raise ValueError("timestamps and kwh arrays must have the same length")
+        self.timestamps = np.concatenate([self.timestamps, ts_arr])
+        self.kwh = np.concatenate([self.kwh, kwh_arr])
 
     def calculate_total_consumption(self) -> float:
-        return float(sum(r.kwh for r in self.meter_readings))
+        return float(self.kwh.sum())
 
     def to_dataframe(self) -> pd.DataFrame:
         return pd.DataFrame(
             {
                 "building": self.name,
-                "timestamp": [r.timestamp for r in self.meter_readings],
-                "kwh": [r.kwh for r in self.meter_readings],
+                "timestamp": self.timestamps,
+                "kwh": self.kwh,
             }
         )
 
     def generate_report(self) -> Dict[str, float]:
-        df = self.to_dataframe()
-        total = df["kwh"].sum()
-        mean = df["kwh"].mean()
-        min_val = df["kwh"].min()
-        max_val = df["kwh"].max()
+        total, min_val, max_val, cnt = _reduce_array(self.kwh)
+        if cnt == 0:
+            # nothing to sum is 0 kWh; mean/min/max are undefined
+            mean = min_val = max_val = np.nan
+        else:
+            mean = total / cnt
         return {
             "building": self.name,
             "total_kwh": float(total),
@@ -75,106 +182,298 @@ class BuildingManager:
         return self.buildings[name]
 
     def from_dataframe(self, df: pd.DataFrame):
-        for _, row in df.iterrows():
-            b = self.get_or_create_building(row["building"])
-            b.add_reading(MeterReading(row["timestamp"], row["kwh"]))
+        for name, g in df.groupby("building", sort=False, observed=True):
+            self.get_or_create_building(name).extend_readings(
+                g["timestamp"].to_numpy(), g["kwh"].to_numpy()
+            )
 
     def generate_all_reports(self) -> pd.DataFrame:
-        reports = [b.generate_report() for b in self.buildings.values()]
-        return pd.DataFrame(reports)
+        buildings = list(self.buildings.values())
+        if not buildings:
+            return pd.DataFrame(
+                columns=["building", "total_kwh", "mean_kwh", "min_kwh", "max_kwh"]
+            )
+        sizes = [len(b.kwh) for b in buildings]
+        labels = np.repeat(np.arange(len(buildings), dtype=np.int64), sizes)
+        values = np.concatenate([b.kwh for b in buildings])
+        sums, mins, maxs, cnts = _reduce_group(labels, values, len(buildings))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / cnts
+        # buildings without readings have no min/max, not the kernel's sentinels
+        empty = cnts == 0
+        means[empty] = np.nan
+        mins[empty] = np.nan
+        maxs[empty] = np.nan
+        return pd.DataFrame(
+            {
+                "building": [b.name for b in buildings],
+                "total_kwh": sums,
+                "mean_kwh": means,
+                "min_kwh": mins,
+                "max_kwh": maxs,
+            }
+        )
 
 
 # ----------------- TASK 1: DATA INGESTION & VALIDATION -----------------
+def ingest_cache_path(csv_files: List[Path]) -> Path:
+    stats = [(str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in csv_files]
+    key = (INGEST_CACHE_VERSION, sorted(stats))
+    fp = hashlib.blake2b(str(key).encode()).hexdigest()[:16]
+    return OUTPUT_DIR / f"ingest_{fp}.parquet"
+
+
+def _to_naive_datetime(raw: pd.Series, fmt) -> pd.Series:
+    # like the original to_datetime(errors="coerce"), zoned values become NaT
+    # rather than being shifted onto the naive local readings
+    with warnings.catch_warnings():
+        # format inference warns when it falls back to dateutil; NaT is enough
+        warnings.simplefilter("ignore", UserWarning)
+        try:
+            parsed = pd.to_datetime(raw, format=fmt, errors="coerce", cache=True)
+        except ValueError:  # mixed time zones
+            parsed = None
+    if parsed is None or parsed.dt.tz is not None:
+        return pd.Series(pd.NaT, index=raw.index, dtype="datetime64[ns]")
+    return parsed
+
+
+def parse_timestamps(raw: pd.Series) -> pd.Series:
+    """to_datetime with pinned formats first; inference only for leftovers."""
+    zoned = raw.notna() & raw.astype(str).str.contains(TZ_SUFFIX, regex=True)
+    raw = raw.mask(zoned)
+    parsed = _to_naive_datetime(raw, TIMESTAMP_FORMATS[0])
+    for fmt in TIMESTAMP_FORMATS[1:] + (None,):
+        missing = parsed.isna() & raw.notna()
+        if not missing.any():
+            break
+        parsed[missing] = _to_naive_datetime(raw[missing], fmt)
+    return parsed
+
+
+def _read_one_csv_tolerant(file: Path, building_name: str) -> List[pa.Table]:
+    """Fallback pandas reader for files the typed Arrow parse rejects."""
+    try:
+        df = pd.read_csv(file, on_bad_lines="skip")
+        if "timestamp" not in df.columns or "kwh" not in df.columns:
+            logging.warning("File %s missing required columns, skipping", file.name)
+            return []
+        df["timestamp"] = parse_timestamps(df["timestamp"])
+        df["kwh"] = pd.to_numeric(df["kwh"], errors="coerce")
+        df = df.dropna(subset=["timestamp", "kwh"])
+        df["building"] = building_name
+        return [
+            pa.Table.from_pandas(
+                df[["timestamp", "kwh", "building"]], preserve_index=False
+            ).cast(CSV_SCHEMA)
+        ]
+    except Exception as e:
+        logging.error("Error reading %s: %s", file.name, e)
+    return []
+
+
+def _read_one_csv(file: Path) -> List[pa.Table]:
+    """Cleaned (timestamp, kwh, building) table of one CSV; empty if skipped."""
+    building_name = file.stem.replace("_", " ").title()
+    try:
+        logging.info("Reading file: %s", file.name)
+        tbl = pac.read_csv(
+            file,
+            convert_options=CSV_CONVERT_OPTIONS,
+            parse_options=CSV_PARSE_OPTIONS,  # skip illeagel lines
+        )
+
+        # ensure required columns
+        if "timestamp" not in tbl.column_names or "kwh" not in tbl.column_names:
+            logging.warning("File %s missing required columns, skipping", file.name)
+            return []
+
+        tbl = tbl.select(["timestamp", "kwh"]).drop_null()
+        return [tbl.append_column("building", pa.repeat(building_name, tbl.num_rows))]
+    except pa.ArrowInvalid as e:
+        # typed parse failed (e.g. malformed timestamp), use tolerant path
+        logging.warning("Typed parse failed for %s (%s), falling back", file.name, e)
+        return _read_one_csv_tolerant(file, building_name)
+    except FileNotFoundError:
+        logging.error("File not found: %s", file.name)
+    except Exception as e:
+        logging.error("Error reading %s: %s", file.name, e)
+    return []
+
+
+def iter_clean_chunks(csv_files: List[Path]) -> Iterator[pa.Table]:
+    """Yield the cleaned table of every CSV; files are parsed concurrently."""
+    # parsing releases the GIL, so threads overlap I/O and conversion
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        for chunks in ex.map(_read_one_csv, csv_files):
+            yield from chunks
+
+
 def load_energy_data(data_dir: Path) -> pd.DataFrame:
-    logging.info(f"Starting data ingestion from: {data_dir}")
-    all_frames = []
+    logging.info("Starting data ingestion from: %s", data_dir)
+    all_tables = []
 
     if not data_dir.exists():
-        logging.error(f"Data directory not found: {data_dir}")
+        logging.error("Data directory not found: %s", data_dir)
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
 
-    for file in data_dir.glob("*.csv"):
-        try:
-            logging.info(f"Reading file: {file.name}")
-            df = pd.read_csv(file, on_bad_lines="skip")  # skip illeagel lines
+    # reuse the cleaned frame from a previous run if no CSV has changed
+    csv_files = sorted(data_dir.glob("*.csv"))
+    cache_path = ingest_cache_path(csv_files)
+    if cache_path.exists():
+        logging.info("Loading cached ingest from %s", cache_path)
+        return pd.read_parquet(cache_path)
 
-            # ensure required columns
-            if "timestamp" not in df.columns or "kwh" not in df.columns:
-                logging.warning(f"File {file.name} missing required columns, skipping")
-                continue
+    all_tables.extend(iter_clean_chunks(csv_files))
 
-            df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-            df = df.dropna(subset=["timestamp", "kwh"])
+    if not all_tables:
+        raise ValueError("No valid CSV files were loaded from data directory.")
 
-            building_name = file.stem.replace("_", " ").title()
-            df["building"] = building_name
+    df_combined = pa.concat_tables(all_tables, promote_options="default").to_pandas(
+        self_destruct=True
+    )
 
-            all_frames.append(df)
-        except FileNotFoundError:
-            logging.error(f"File not found: {file.name}")
-        except Exception as e:
-            logging.error(f"Error reading {file.name}: {e}")
+    # shrink the hot columns: float32 readings, building names as category codes
+    df_combined["kwh"] = pd.to_numeric(df_combined["kwh"], downcast="float")
+    df_combined["building"] = df_combined["building"].astype("category")
 
-    if not all_frames:
-        raise ValueError("No valid CSV files were loaded from data directory.")
+    # one stable sort so the cleaned export is grouped per building, in time order
+    df_combined.sort_values(["building", "timestamp"], kind="stable", inplace=True)
+    df_combined.reset_index(drop=True, inplace=True)
+    logging.info("Combined dataframe shape: %s", df_combined.shape)
 
-    df_combined = pd.concat(all_frames, ignore_index=True)
-    df_combined.sort_values("timestamp", inplace=True)
-    logging.info(f"Combined dataframe shape: {df_combined.shape}")
+    for stale in OUTPUT_DIR.glob("ingest_*.parquet"):
+        stale.unlink()
+    df_combined.to_parquet(cache_path, compression="zstd", index=False)
+    logging.info("Ingest cache saved to %s", cache_path)
     return df_combined
 
 
 # ----------------- TASK 2: AGGREGATION LOGIC -----------------
-def calculate_daily_totals(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.set_index("timestamp")
-    daily = (
-        df.groupby("building")["kwh"]
-        .resample("D")
-        .sum()
-        .reset_index()
-        .rename(columns={"kwh": "daily_kwh"})
+def building_codes(df: pd.DataFrame):
+    """Integer building codes and their names, computed once per frame."""
+    building = df["building"]
+    if not isinstance(building.dtype, pd.CategoricalDtype):
+        building = building.astype("category")
+    # categorical codes are the factorization done at ingest; no rehashing
+    return building.cat.codes.to_numpy(), building.cat.categories
+
+
+class Aggregates(NamedTuple):
+    daily: pd.DataFrame
+    weekly: pd.DataFrame
+    summary: pd.DataFrame
+
+
+def compute_daily_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-building daily kWh, equivalent to groupby("building").resample("D").sum()."""
+    codes, names = building_codes(df)
+    day = df.index.to_numpy().astype("datetime64[D]").astype(np.int64)
+    if len(day) == 0:
+        return pd.DataFrame(
+            {
+                "building": df["building"].iloc[:0],
+                "timestamp": df.index[:0],
+                "daily_kwh": df["kwh"].iloc[:0],
+            }
+        )
+
+    # dense (building, day) key -> one weighted bincount instead of hash + bin
+    first_day = day.min()
+    span = int(day.max() - first_day) + 1
+    key = codes.astype(np.int64) * span + (day - first_day)
+    n = len(names) * span
+    sums = np.bincount(key, weights=df["kwh"].to_numpy(), minlength=n)
+    counts = np.bincount(key, minlength=n)
+    sums = sums.reshape(len(names), span)
+    present = counts.reshape(len(names), span) > 0
+
+    # like resample, keep each building's days from its first to last reading
+    cols = np.arange(span)
+    start = present.argmax(axis=1)
+    stop = span - present[:, ::-1].argmax(axis=1)
+    keep = (cols >= start[:, None]) & (cols < stop[:, None])
+    keep &= present.any(axis=1)[:, None]
+
+    b_idx, d_idx = np.nonzero(keep)
+    return pd.DataFrame(
+        {
+            "building": pd.Categorical.from_codes(b_idx, categories=names),
+            "timestamp": (first_day + d_idx)
+            .astype("datetime64[D]")
+            .astype(df.index.dtype),
+            "daily_kwh": sums[b_idx, d_idx].astype(df["kwh"].dtype),
+        }
     )
-    return daily
 
 
-def calculate_weekly_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+def compute_all_aggregates(df: pd.DataFrame) -> Aggregates:
+    # index once and reuse the same building grouper for every aggregation
     df = df.set_index("timestamp")
+    codes, names = building_codes(df)
+    # rows without a building get code -1; drop them like groupby drops NaN keys
+    valid = codes >= 0
+    if not valid.all():
+        df = df[valid]
+        codes = codes[valid]
+    gb = df.groupby("building", sort=False, observed=True)["kwh"]
+
+    daily = compute_daily_totals(df)
     weekly = (
-        df.groupby("building")["kwh"]
-        .resample("W")
+        gb.resample("W")
         .sum()
         .reset_index()
         .rename(columns={"kwh": "weekly_kwh"})
     )
-    return weekly
-
-
-def building_wise_summary(df: pd.DataFrame) -> pd.DataFrame:
-    summary = (
-        df.groupby("building")["kwh"]
-        .agg(["mean", "min", "max", "sum"])
-        .reset_index()
-        .rename(
-            columns={
-                "mean": "mean_kwh",
-                "min": "min_kwh",
-                "max": "max_kwh",
-                "sum": "total_kwh",
-            }
-        )
+    sums, mins, maxs, cnts = _reduce_group(
+        codes.astype(np.int64), df["kwh"].to_numpy(np.float64), len(names)
     )
-    return summary
+    # accumulate in float64, report in the frame's own kwh dtype; a building
+    # whose readings are all NaN is still listed, with NaN mean/min/max
+    seen = np.bincount(codes, minlength=len(names)) > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / cnts
+    empty = cnts == 0
+    means[empty] = np.nan
+    mins[empty] = np.nan
+    maxs[empty] = np.nan
+    out_dtype = df["kwh"].dtype
+    summary = pd.DataFrame(
+        {
+            "building": names[seen],
+            "mean_kwh": means[seen].astype(out_dtype),
+            "min_kwh": mins[seen].astype(out_dtype),
+            "max_kwh": maxs[seen].astype(out_dtype),
+            "total_kwh": sums[seen].astype(out_dtype),
+        }
+    )
+    return Aggregates(daily, weekly, summary)
 
 
 # ----------------- TASK 4: VISUAL OUTPUT -----------------
+def peak_positions(df: pd.DataFrame) -> np.ndarray:
+    """Row position of the highest kWh reading for each building."""
+    codes, _ = building_codes(df)
+    if len(codes) == 0:
+        return np.empty(0, np.int64)
+    # stable sort by building, then kwh descending: each run starts at its peak
+    order = np.lexsort((-df["kwh"].to_numpy(), codes))
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return order[starts]
+
+
 def create_dashboard_figure(
     daily: pd.DataFrame, weekly: pd.DataFrame, df: pd.DataFrame, out_path: Path
 ):
-    fig, axes = plt.subplots(3, 1, figsize=(12, 14))
+    # plain Agg figure: no pyplot state, buffer freed right after saving
+    fig = Figure(figsize=(12, 14))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(3, 1)
 
     # Line: daily consumption trend for all buildings
-    for b_name, group in daily.groupby("building"):
-        axes[0].plot(group["timestamp"], group["daily_kwh"], label=b_name)
+    wide = daily.pivot(index="timestamp", columns="building", values="daily_kwh")
+    axes[0].plot(wide.index.to_numpy(), wide.to_numpy(), label=wide.columns.tolist())
     axes[0].set_title("Daily Energy Consumption - K.R. Mangalam University")
     axes[0].set_xlabel("Date")
     axes[0].set_ylabel("Daily kWh")
@@ -183,7 +482,9 @@ def create_dashboard_figure(
 
     # Bar: average weekly usage across buildings
     weekly_mean = (
-        weekly.groupby("building")["weekly_kwh"].mean().reset_index()
+        weekly.groupby("building", sort=False, observed=True)["weekly_kwh"]
+        .mean()
+        .reset_index()
     )
     axes[1].bar(weekly_mean["building"], weekly_mean["weekly_kwh"])
     axes[1].set_title("Average Weekly Energy Use by Building")
@@ -193,19 +494,19 @@ def create_dashboard_figure(
 
     # Scatter: peak-hour consumption vs time
     # Peak-hour consumption by hour of day instead of timestamp
-    idx = df.groupby("building")["kwh"].idxmax()
-    peaks = df.loc[idx].copy()
-
+    first = peak_positions(df)
+    peaks_name = df["building"].to_numpy()[first]
     # Extract hour to fix x-axis
-    peaks["hour"] = peaks["timestamp"].dt.hour
+    peaks_hour = pd.DatetimeIndex(df["timestamp"].to_numpy()[first]).hour.to_numpy()
+    peaks_kwh = df["kwh"].to_numpy()[first]
 
-    axes[2].scatter(peaks["hour"], peaks["kwh"])
+    axes[2].scatter(peaks_hour, peaks_kwh, rasterized=True)
 
     # Add labels
-    for _, row in peaks.iterrows():
+    for h, k, n in zip(peaks_hour.tolist(), peaks_kwh.tolist(), peaks_name.tolist()):
         axes[2].annotate(
-            row["building"],
-            (row["hour"], row["kwh"]),
+            n,
+            (h, k),
             textcoords="offset points",
             xytext=(0, 5),
             ha="center",
@@ -218,13 +519,57 @@ def create_dashboard_figure(
     axes[2].set_xticks(range(0, 24))
     axes[2].grid(True)
 
-    plt.tight_layout()
-    fig.savefig(out_path)
-    plt.close(fig)
-    logging.info(f"Dashboard saved to {out_path}")
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=100, metadata={})
+    fig.clear()
+    logging.info("Dashboard saved to %s", out_path)
 
 
 # ----------------- TASK 5: PERSISTENCE & SUMMARY -----------------
+CSV_STRUCTURAL_CHARS = r'[",\r\n]'
+
+
+def _needs_quoting(tbl: pa.Table) -> bool:
+    """True if any header or string value holds a delimiter, quote or newline."""
+    if any(re.search(CSV_STRUCTURAL_CHARS, name) for name in tbl.column_names):
+        return True
+    for col in tbl.columns:
+        if pa.types.is_dictionary(col.type):
+            col = pc.cast(col, col.type.value_type)
+        if pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+            if pc.any(pc.match_substring_regex(col, CSV_STRUCTURAL_CHARS)).as_py():
+                return True
+    return False
+
+
+def write_csv(df: pd.DataFrame, path: Path):
+    """Write a frame as CSV from its columnar buffers via PyArrow."""
+    tbl = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(tbl.schema):
+        if pa.types.is_timestamp(field.type):
+            # whole-second timestamps print without a nanosecond fraction
+            try:
+                tbl = tbl.set_column(
+                    i, field.name, tbl.column(i).cast(pa.timestamp("s"))
+                )
+            except pa.ArrowInvalid:
+                pass
+        elif pa.types.is_floating(field.type):
+            # render whole floats as "4.0" like to_csv, not Arrow's "4"
+            text = pc.cast(tbl.column(i), pa.string())
+            whole = pc.match_substring_regex(text, r"^-?\d+$")
+            text = pc.if_else(whole, pc.binary_join_element_wise(text, ".0", ""), text)
+            tbl = tbl.set_column(i, field.name, text)
+    # keep the unquoted style unless some value actually needs quoting
+    if _needs_quoting(tbl):
+        write_options = pac.WriteOptions(batch_size=65536)
+    else:
+        write_options = pac.WriteOptions(
+            batch_size=65536, quoting_header="none", quoting_style="none"
+        )
+    pac.write_csv(tbl, path, write_options=write_options)
+
+
 def export_results(
     df_clean: pd.DataFrame,
     building_summary: pd.DataFrame,
@@ -234,11 +579,15 @@ def export_results(
     cleaned_path = OUTPUT_DIR / "cleaned_energy_data.csv"
     summary_path = OUTPUT_DIR / "building_summary.csv"
 
-    df_clean.to_csv(cleaned_path, index=False)
-    building_summary.to_csv(summary_path, index=False)
+    write_csv(df_clean, cleaned_path)
+    write_csv(building_summary, summary_path)
 
-    logging.info(f"Cleaned data saved to {cleaned_path}")
-    logging.info(f"Building summary saved to {summary_path}")
+    # columnar copies for machine consumers
+    df_clean.to_parquet(cleaned_path.with_suffix(".parquet"), index=False)
+    building_summary.to_parquet(summary_path.with_suffix(".parquet"), index=False)
+
+    logging.info("Cleaned data saved to %s", cleaned_path)
+    logging.info("Building summary saved to %s", summary_path)
 
     # Campus-level summary
     total_campus_kwh = df_clean["kwh"].sum()
@@ -277,7 +626,7 @@ def export_results(
         f.write(summary_text)
 
     print("\n" + summary_text)
-    logging.info(f"Summary report saved to {summary_file}")
+    logging.info("Summary report saved to %s", summary_file)
 
 
 # ----------------- MAIN DRIVER -----------------
@@ -288,21 +637,20 @@ def main():
     df_combined = load_energy_data(DATA_DIR)
 
     # Task 2: Aggregations
-    daily_totals = calculate_daily_totals(df_combined.copy())
-    weekly_aggregates = calculate_weekly_aggregates(df_combined.copy())
-    building_summary = building_wise_summary(df_combined.copy())
+    daily_totals, weekly_aggregates, building_summary = compute_all_aggregates(
+        df_combined
+    )
 
     # Task 3: OOP usage (optional but demonstrates structure)
     manager = BuildingManager()
-    df_for_oop = df_combined.copy()
-    manager.from_dataframe(df_for_oop)
+    manager.from_dataframe(df_combined)
     reports_df = manager.generate_all_reports()
-    logging.info("OOP Reports:\n" + str(reports_df))
+    logging.info("OOP Reports:\n%s", reports_df)
 
     # Task 4: Dashboard figure
     dashboard_path = OUTPUT_DIR / "dashboard.png"
     create_dashboard_figure(
-        daily_totals, weekly_aggregates, df_combined.copy(), dashboard_path
+        daily_totals, weekly_aggregates, df_combined, dashboard_path
     )
 
     # Task 5: Persistence & summary